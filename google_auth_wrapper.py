@@ -12,7 +12,9 @@ Key responsibilities:
 """
 
 import datetime
+import os
 import requests
+from requests.adapters import HTTPAdapter
 from nest_device import NestDevice 
 
 from tools import logger
@@ -24,7 +26,7 @@ class GLocalAuthenticationTokensMultiService(glocaltokens.client.GLocalAuthentic
 
     The base glocaltokens client caches a single access token, but Nest API
     requires a different OAuth scope than default Google Home. This extension
-    tracks which scope was used and refreshes when the scope changes.
+    keeps a per-scope token cache so both scopes stay warm simultaneously.
 
     Token lifecycle:
     - Cached until expiration (typically 1 hour)
@@ -32,21 +34,35 @@ class GLocalAuthenticationTokensMultiService(glocaltokens.client.GLocalAuthentic
     - Per-scope caching (different tokens for different services)
     """
 
-    def __init__(self, *args, **kwargs) -> None:
+    # Refresh tokens this long before Google's expiry, matching the 5-minute
+    # window Google's own metadata server uses. The scheduler ticks every few
+    # minutes anyway, so giving up the last minutes of a token's life is free.
+    DEFAULT_TOKEN_LEEWAY_SECONDS = 300
+
+    def __init__(self, *args, leeway=None, **kwargs) -> None:
         super(GLocalAuthenticationTokensMultiService, self).__init__(*args, **kwargs)
 
-        self._last_access_token_service = None
-    
+        # Per-scope token cache: {service: (token, issued_at)}. Keeping both
+        # the Google Home and Nest tokens warm avoids a fresh OAuth round trip
+        # every time the two scopes are used alternately within a sync tick.
+        self._token_cache: dict[str, tuple[str, datetime.datetime]] = {}
+        if leeway is None:
+            leeway = self.DEFAULT_TOKEN_LEEWAY_SECONDS
+        self._leeway = datetime.timedelta(seconds=leeway)
+
+    def _token_needs_refresh(self, token_date) -> bool:
+        """Check if a token issued at token_date is expired or about to expire"""
+        duration = glocaltokens.client.ACCESS_TOKEN_DURATION
+        if not isinstance(duration, datetime.timedelta):
+            duration = datetime.timedelta(seconds=duration)
+        return datetime.datetime.now() + self._leeway >= token_date + duration
+
     def get_access_token(self, service=glocaltokens.client.ACCESS_TOKEN_SERVICE) -> str | None:
-        """Return existing or fetch access_token"""
-        if (
-            self.access_token is None
-            or self.access_token_date is None
-            or self._has_expired(self.access_token_date, glocaltokens.client.ACCESS_TOKEN_DURATION)
-            or self._last_access_token_service != service
-        ):
+        """Return existing or fetch access_token for the given service scope"""
+        cached = self._token_cache.get(service)
+        if cached is None or self._token_needs_refresh(cached[1]):
             logger.debug(
-                "There is no access_token stored, "
+                "There is no access_token stored for this service, "
                 "or it has expired, getting a new one..."
             )
             master_token = self.get_master_token()
@@ -68,9 +84,12 @@ class GLocalAuthenticationTokensMultiService(glocaltokens.client.GLocalAuthentic
                 logger.error("[!] Could not get access token.")
                 logger.debug("Request response: %s", res)
                 return None
-            self.access_token = res["Auth"]
-            self.access_token_date = datetime.datetime.now()
-            self._last_access_token_service = service
+            cached = (res["Auth"], datetime.datetime.now())
+            self._token_cache[service] = cached
+
+        # Keep the base-class attributes pointing at the token we just served,
+        # for any callers that still read them directly.
+        self.access_token, self.access_token_date = cached
         logger.debug(
             "Access token: %s, datetime %s",
             self.access_token,
@@ -91,40 +110,86 @@ class GoogleConnection(object):
 
     NEST_SCOPE = "oauth2:https://www.googleapis.com/auth/nest-account"
 
+    # How long a HomeGraph response stays fresh. Device lists change rarely,
+    # so repeat discovery within the window skips the protobuf-over-HTTPS RPC.
+    HOMEGRAPH_CACHE_TTL_SECONDS = 600
+
     def __init__(self, master_token, username, password="FAKE_PASSWORD"):
+        try:
+            leeway = int(os.getenv("TOKEN_REFRESH_LEEWAY_SECONDS", "300"))
+        except ValueError:
+            logger.warning("Invalid TOKEN_REFRESH_LEEWAY_SECONDS, using default of 300 seconds")
+            leeway = 300
+
         self._google_auth = GLocalAuthenticationTokensMultiService(
-            master_token=master_token, 
-            username=username, 
+            master_token=master_token,
+            username=username,
             password=password,
+            leeway=leeway,
         )
 
-    def make_nest_get_request(self, device_id : str, url : str, params={}):
+        # One session for all Google API calls (shared with GoogleHomeEvents).
+        # Keep-alive connections avoid a DNS lookup + TLS handshake per request.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.session.headers["User-Agent"] = "google-nest-telegram-sync"
+
+        self._homegraph_cache = None
+        self._homegraph_cache_time = None
+
+    def _fetch_homegraph(self):
+        """Fetch the HomeGraph, serving a cached response while it is fresh"""
+        now = datetime.datetime.now()
+        if (
+            self._homegraph_cache is not None
+            and now - self._homegraph_cache_time < datetime.timedelta(seconds=self.HOMEGRAPH_CACHE_TTL_SECONDS)
+        ):
+            logger.debug("Using cached HomeGraph response")
+            return self._homegraph_cache
+
+        self._homegraph_cache = self._google_auth.get_homegraph()
+        self._homegraph_cache_time = now
+        return self._homegraph_cache
+
+    def invalidate_homegraph_cache(self):
+        """Drop the cached HomeGraph so the next discovery fetches fresh data"""
+        self._homegraph_cache = None
+        self._homegraph_cache_time = None
+
+    def make_nest_get_request(self, url : str, params={}, stream : bool = False):
         """
         Make authenticated GET request to Nest API.
 
         Args:
-            device_id: Nest device ID
-            url: URI template with {device_id} placeholder
+            url: Full request URL (e.g. NestDevice.download_video_url)
             params: Query parameters
+            stream: When True, return the streaming Response instead of buffering
+                the whole body in memory. The caller must close it.
 
         Returns:
-            Response content (bytes for video, parsed data for other endpoints)
+            Response content (bytes for video, parsed data for other endpoints),
+            or the open requests.Response when stream=True
         """
-        url = url.format(device_id=device_id)
         logger.debug(f"Sending request to: '{url}' with params: '{params}'")
 
         access_token = self._google_auth.get_access_token(service=GoogleConnection.NEST_SCOPE)
         if not access_token:
             raise Exception("Couldn't get a Nest access token")
-        
-        res = requests.get(
-            url=url, 
-            params=params, 
+
+        res = self.session.get(
+            url=url,
+            params=params,
             headers={
                 "Authorization": f"Bearer {access_token}"
-            }
+            },
+            stream=stream,
+            timeout=(5, 60) if stream else (5, 30),
         )
         res.raise_for_status()
+        if stream:
+            # Peak memory stays at one chunk instead of the whole clip;
+            # multi-MB videos otherwise sit in RAM twice (pool buffer + content)
+            return res
         return res.content
 
     def get_nest_camera_devices(self):
@@ -135,15 +200,27 @@ class GoogleConnection(object):
             List of NestDevice objects for all Nest cameras in the Google account.
             Each device has Nest device ID and Google Home device ID for API calls.
         """
-        homegraph_response = self._google_auth.get_homegraph()
-
-        return [
-            NestDevice(
-                connection=self,
-                device_id=device.device_info.agent_info.unique_id,
-                device_name=device.device_name,
-                google_home_device_id=device.device_info.device_id  # For Google Home API
+        homegraph_response = self._fetch_homegraph()
+
+        devices = []
+        for device in homegraph_response.home.devices:
+            # frozenset turns the protobuf repeated-field linear scan into a hash lookup
+            traits = frozenset(device.traits)
+            if "action.devices.traits.CameraStream" not in traits:
+                continue
+            if "Nest" not in device.hardware.model:
+                continue
+
+            # Bind the nested protobuf messages once; each chained descriptor
+            # lookup re-resolves (and allocates) otherwise
+            device_info = device.device_info
+            agent_info = device_info.agent_info
+            devices.append(
+                NestDevice(
+                    connection=self,
+                    device_id=agent_info.unique_id,
+                    device_name=device.device_name,
+                    google_home_device_id=device_info.device_id  # For Google Home API
+                )
             )
-            for device in homegraph_response.home.devices
-            if "action.devices.traits.CameraStream" in device.traits and "Nest" in device.hardware.model
-        ]
+        return devices
@@ -13,38 +13,52 @@ Architecture:
 - Graceful degradation: returns empty list if API fails
 """
 
-import requests
+import logging
+import orjson
 import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-from tools import logger
+from tools import logger, VERBOSE
 
+# C-level tzinfo; avoids pytz's lookup/localize overhead per conversion
+_UTC = datetime.timezone.utc
 
-@dataclass
+
+def _time_array_to_ms(time_array) -> int:
+    """Convert a Foyer [seconds, nanoseconds] pair to milliseconds since epoch"""
+    seconds, nanos = time_array[0], time_array[1]
+    return int(seconds) * 1000 + int(nanos) // 1_000_000
+
+
+@dataclass(slots=True)
 class GoogleHomeEvent:
     """
     Camera event from Google Home API.
 
+    Millisecond timestamps are the primary representation - downstream
+    matching and video downloads work in epoch ms, so datetime objects are
+    only materialized on demand (caption rendering).
+
     Attributes:
         event_id: Unique identifier from Google Home
         description: Event type (e.g., "Person", "Package seen · Person")
-        start_time: Event start in UTC (datetime object)
-        end_time: Event end in UTC (datetime object)
+        start_time_ms: Event start in milliseconds since epoch
+        end_time_ms: Event end in milliseconds since epoch
     """
     event_id: str
     description: str
-    start_time: datetime.datetime
-    end_time: datetime.datetime
+    start_time_ms: int
+    end_time_ms: int
 
     @property
-    def start_time_ms(self) -> int:
-        """Start time in milliseconds since epoch."""
-        return int(self.start_time.timestamp() * 1000)
+    def start_time(self) -> datetime.datetime:
+        """Event start in UTC (datetime object)."""
+        return datetime.datetime.fromtimestamp(self.start_time_ms / 1000, tz=_UTC)
 
     @property
-    def end_time_ms(self) -> int:
-        """End time in milliseconds since epoch."""
-        return int(self.end_time.timestamp() * 1000)
+    def end_time(self) -> datetime.datetime:
+        """Event end in UTC (datetime object)."""
+        return datetime.datetime.fromtimestamp(self.end_time_ms / 1000, tz=_UTC)
 
 
 class GoogleHomeEvents:
@@ -76,6 +90,56 @@ class GoogleHomeEvents:
             google_connection: GoogleConnection instance (already authenticated)
         """
         self._connection = google_connection
+        # Share the connection's pooled session so Foyer calls reuse keep-alive
+        # connections instead of paying a TLS handshake per request
+        self._session = google_connection.session
+        # Reusable header dict; only the Authorization entry is rewritten, and
+        # only when the access token actually changes
+        self._headers = dict(self.HEADERS_BASE)
+        self._cached_token = None
+
+    def _fetch_timeline(self, device_id: str, start_time_ms: int, end_time_ms: int):
+        """
+        POST to the Foyer timeline endpoint and return the parsed JSON payload.
+
+        Shared fetch core for get_events/get_event_types.
+
+        Returns:
+            Parsed timeline data, or None if the API call fails
+        """
+        # OAuth access token (auto-refreshed by glocaltokens)
+        access_token = self._connection._google_auth.get_access_token()
+        if not access_token:
+            logger.warning("Could not get access token for Google Home API")
+            return None
+
+        end_sec, end_rem = divmod(end_time_ms, 1000)
+        end_ns = end_rem * 1_000_000
+        start_sec, start_rem = divmod(start_time_ms, 1000)
+        start_ns = start_rem * 1_000_000
+
+        payload = [[device_id, [end_sec, end_ns], [start_sec, start_ns], None, 12], 1]
+
+        if access_token != self._cached_token:
+            self._headers['Authorization'] = f'Bearer {access_token}'
+            self._cached_token = access_token
+
+        logger.debug(f"Fetching events from Google Home API for device {device_id}")
+
+        response = self._session.post(
+            self.FOYER_ENDPOINT,
+            headers=self._headers,
+            json=payload,
+            timeout=10
+        )
+
+        if response.status_code != 200:
+            logger.warning(f"Google Home API returned status {response.status_code}")
+            return None
+
+        # orjson is ~2-3x faster than stdlib json on the big
+        # arrays-of-small-lists payloads Foyer returns
+        return orjson.loads(response.content)
 
     def get_events(self, device_id: str, start_time_ms: int, end_time_ms: int) -> List[GoogleHomeEvent]:
         """
@@ -91,44 +155,30 @@ class GoogleHomeEvents:
             Returns empty list if API call fails (graceful degradation)
         """
         try:
-            # OAuth access token (auto-refreshed by glocaltokens)
-            access_token = self._connection._google_auth.get_access_token()
-            if not access_token:
-                logger.warning("Could not get access token for Google Home API")
+            timeline_data = self._fetch_timeline(device_id, start_time_ms, end_time_ms)
+            if timeline_data is None:
                 return []
-
-            end_sec = end_time_ms // 1000
-            end_ns = (end_time_ms % 1000) * 1000000
-            start_sec = start_time_ms // 1000
-            start_ns = (start_time_ms % 1000) * 1000000
-
-            payload = [[device_id, [end_sec, end_ns], [start_sec, start_ns], None, 12], 1]
-
-            headers = {
-                **self.HEADERS_BASE,
-                'Authorization': f'Bearer {access_token}',
-            }
-
-            logger.debug(f"Fetching events from Google Home API for device {device_id}")
-
-            response = requests.post(
-                self.FOYER_ENDPOINT,
-                headers=headers,
-                json=payload,
-                timeout=10
-            )
-
-            if response.status_code != 200:
-                logger.warning(f"Google Home API returned status {response.status_code}")
-                return []
-
-            # Parse response
-            return self._parse_events(response.json())
+            return self._parse_events(timeline_data)
 
         except Exception as e:
             logger.warning(f"Failed to fetch events from Google Home API: {e}")
             return []
 
+    def get_event_types(self, device_id: str, start_time_ms: int, end_time_ms: int) -> Dict[str, str]:
+        """
+        Fetch events and project them to a flat {start_time_ms: description} map.
+
+        Convenience view over get_events for callers that only need to match
+        event descriptions by timestamp.
+
+        Returns:
+            Dict keyed by millisecond start timestamp (as string); empty on failure
+        """
+        return {
+            str(event.start_time_ms): event.description
+            for event in self.get_events(device_id, start_time_ms, end_time_ms)
+        }
+
     def _parse_events(self, timeline_data) -> List[GoogleHomeEvent]:
         """
         Parse events from Google Home API response.
@@ -139,17 +189,23 @@ class GoogleHomeEvents:
         Returns:
             List of GoogleHomeEvent objects
         """
-        from tools import VERBOSE
-        import pytz
+        # Evaluated once; the per-event debug lines below otherwise format
+        # datetimes into f-strings just for the logging framework to drop them
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         events = []
-        events_by_timestamp = {}  # Temp dict for combining events at same time
+        # Staged per-timestamp groups; "seen" gives O(1) duplicate-description
+        # checks instead of substring scans of the combined description
+        groups: dict = {}
 
         try:
             if not timeline_data or len(timeline_data) < 2:
                 return events
 
             timeline_periods = timeline_data[1]
+            if not timeline_periods:
+                # Common "no new events" case - skip the nested loops entirely
+                return events
 
             for period in timeline_periods:
                 if not period or len(period) < 3:
@@ -161,47 +217,49 @@ class GoogleHomeEvents:
 
                 # Each event: [event_id, description, timestamp_str, [start_time], [end_time], ...]
                 for event in events_array:
-                    if not event or len(event) < 5:
+                    # Tuple unpacking beats five separate __getitem__ dispatches
+                    # and rejects short/malformed entries in one step
+                    try:
+                        event_id, event_description, _, start_time_array, end_time_array, *_rest = event
+                    except (ValueError, TypeError):
                         continue
 
-                    if VERBOSE:
-                        logger.debug(f"Full event structure (length {len(event)}): {event[:10]}")
-
-                    event_id = str(event[0])
-                    event_description = event[1]
-                    start_time_array = event[3]  # [seconds, nanoseconds]
-                    end_time_array = event[4]    # [seconds, nanoseconds]
+                    if VERBOSE and debug_enabled:
+                        logger.debug("Full event structure (length %d): %s", len(event), event[:10])
 
                     if not (event_description and start_time_array and end_time_array
                             and len(start_time_array) >= 2 and len(end_time_array) >= 2):
                         continue
 
-                    # Convert to datetime objects (UTC)
-                    start_timestamp = int(start_time_array[0]) + int(start_time_array[1]) / 1e9
-                    end_timestamp = int(end_time_array[0]) + int(end_time_array[1]) / 1e9
-
-                    start_time = datetime.datetime.fromtimestamp(start_timestamp, tz=pytz.UTC)
-                    end_time = datetime.datetime.fromtimestamp(end_timestamp, tz=pytz.UTC)
-
-                    # Use millisecond timestamp as key for combining events
-                    start_ms = int(start_timestamp * 1000)
-
-                    if start_ms in events_by_timestamp:
-                        existing = events_by_timestamp[start_ms]
-                        if event_description not in existing.description:
-                            existing.description = f"{existing.description}, {event_description}"
-                            logger.info(f"Combined events at {start_ms}: {existing.description}")
-                    else:
-                        new_event = GoogleHomeEvent(
-                            event_id=event_id,
-                            description=event_description,
-                            start_time=start_time,
-                            end_time=end_time
-                        )
-                        events_by_timestamp[start_ms] = new_event
-                        logger.debug(f"Found event: {event_description} at {start_time}")
-
-            events = list(events_by_timestamp.values())
+                    event_id = str(event_id)
+
+                    # Millisecond timestamps; also the key for combining events
+                    start_ms = _time_array_to_ms(start_time_array)
+                    end_ms = _time_array_to_ms(end_time_array)
+
+                    group = groups.setdefault(start_ms, {
+                        "descriptions": [],
+                        "seen": set(),
+                        "event_id": event_id,
+                        "end_ms": end_ms,
+                    })
+                    if event_description not in group["seen"]:
+                        group["seen"].add(event_description)
+                        group["descriptions"].append(event_description)
+                        if len(group["descriptions"]) > 1:
+                            logger.info("Combined events at %d: %s", start_ms, ", ".join(group["descriptions"]))
+                        elif debug_enabled:
+                            logger.debug("Found event: %s at %d", event_description, start_ms)
+
+            events = [
+                GoogleHomeEvent(
+                    event_id=group["event_id"],
+                    description=", ".join(group["descriptions"]),
+                    start_time_ms=start_ms,
+                    end_time_ms=group["end_ms"]
+                )
+                for start_ms, group in groups.items()
+            ]
 
         except Exception as e:
             logger.warning(f"Error parsing Google Home events: {e}")
@@ -18,28 +18,67 @@ from telegram_sync import TelegramEventsSync
 import os
 import datetime
 import asyncio
+from dataclasses import dataclass
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 __version__ = "1.1.3"
 
-GOOGLE_MASTER_TOKEN = os.getenv("GOOGLE_MASTER_TOKEN")
-GOOGLE_USERNAME = os.getenv("GOOGLE_USERNAME")
 
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-TELEGRAM_CHANNEL_ID = os.getenv("TELEGRAM_CHANNEL_ID")
-FORCE_RESEND_ALL = os.getenv("FORCE_RESEND_ALL", "false").lower() in ("true", "1")
-DRY_RUN = os.getenv("DRY_RUN", "false").lower() in ("true", "1")
-
-TIMEZONE = os.getenv("TIMEZONE")
-TIME_FORMAT = os.getenv("TIME_FORMAT")
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """
+    Application configuration, read from the environment exactly once.
 
-try:
-    REFRESH_INTERVAL_MINUTES = int(os.getenv("REFRESH_INTERVAL_MINUTES", "2"))
-except ValueError:
-    logger.warning("Invalid REFRESH_INTERVAL_MINUTES, using default of 2 minutes")
-    REFRESH_INTERVAL_MINUTES = 2
+    Importing this module stays side-effect-free; main() builds the config
+    and passes it down, so config access is plain attribute lookup.
+    """
 
-assert GOOGLE_MASTER_TOKEN and GOOGLE_USERNAME and TELEGRAM_CHANNEL_ID and TELEGRAM_BOT_TOKEN
+    google_master_token: str
+    google_username: str
+    telegram_bot_token: str
+    telegram_channel_id: str
+    force_resend_all: bool
+    dry_run: bool
+    timezone: str | None
+    time_format: str | None
+    refresh_interval_minutes: int
+
+    @classmethod
+    def from_env(cls) -> "AppConfig":
+        """
+        Build the config from environment variables.
+
+        Raises:
+            ValueError: If any required credential is missing
+        """
+        google_master_token = os.getenv("GOOGLE_MASTER_TOKEN")
+        google_username = os.getenv("GOOGLE_USERNAME")
+        telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        telegram_channel_id = os.getenv("TELEGRAM_CHANNEL_ID")
+
+        if not (google_master_token and google_username and telegram_channel_id and telegram_bot_token):
+            raise ValueError(
+                "GOOGLE_MASTER_TOKEN, GOOGLE_USERNAME, TELEGRAM_BOT_TOKEN and "
+                "TELEGRAM_CHANNEL_ID must all be set"
+            )
+
+        try:
+            refresh_interval_minutes = int(os.getenv("REFRESH_INTERVAL_MINUTES", "2"))
+        except ValueError:
+            logger.warning("Invalid REFRESH_INTERVAL_MINUTES, using default of 2 minutes")
+            refresh_interval_minutes = 2
+
+        return cls(
+            google_master_token=google_master_token,
+            google_username=google_username,
+            telegram_bot_token=telegram_bot_token,
+            telegram_channel_id=telegram_channel_id,
+            force_resend_all=os.getenv("FORCE_RESEND_ALL", "false").lower() in ("true", "1"),
+            dry_run=os.getenv("DRY_RUN", "false").lower() in ("true", "1"),
+            timezone=os.getenv("TIMEZONE"),
+            time_format=os.getenv("TIME_FORMAT"),
+            refresh_interval_minutes=refresh_interval_minutes,
+        )
 
 
 def main():
@@ -52,28 +91,30 @@ def main():
     logger.info("Welcome to the Google Nest Doorbell <-> Telegram Sync")
     logger.info(f"Version: {__version__}")
 
+    config = AppConfig.from_env()
+
     logger.info("Initializing the Google connection using the master_token")
-    google_connection = GoogleConnection(GOOGLE_MASTER_TOKEN, GOOGLE_USERNAME)
+    google_connection = GoogleConnection(config.google_master_token, config.google_username)
 
     logger.info("Getting Camera Devices")
     nest_camera_devices = google_connection.get_nest_camera_devices()
     logger.info(f"Found {len(nest_camera_devices)} camera device(s)")
 
     tes = TelegramEventsSync(
-        telegram_bot_token=TELEGRAM_BOT_TOKEN,
-        telegram_channel_id=TELEGRAM_CHANNEL_ID,
+        telegram_bot_token=config.telegram_bot_token,
+        telegram_channel_id=config.telegram_channel_id,
         nest_camera_devices=nest_camera_devices,
         google_connection=google_connection,
-        timezone=TIMEZONE,
-        time_format=TIME_FORMAT,
-        force_resend_all=FORCE_RESEND_ALL,
-        dry_run=DRY_RUN
+        timezone=config.timezone,
+        time_format=config.time_format,
+        force_resend_all=config.force_resend_all,
+        dry_run=config.dry_run
     )
 
     logger.info("Initialized a Telegram Sync")
-    if DRY_RUN:
+    if config.dry_run:
         logger.warning("DRY RUN MODE ENABLED - Videos will NOT be sent to Telegram!")
-    logger.info(f"Syncing every {REFRESH_INTERVAL_MINUTES} minute(s)")
+    logger.info(f"Syncing every {config.refresh_interval_minutes} minute(s)")
 
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -82,7 +123,7 @@ def main():
     scheduler.add_job(
         tes.sync,
         'interval',
-        minutes=REFRESH_INTERVAL_MINUTES,
+        minutes=config.refresh_interval_minutes,
         next_run_time=datetime.datetime.now() + datetime.timedelta(seconds=10)
     )
     scheduler.start()
@@ -95,4 +136,4 @@ def main():
         loop.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
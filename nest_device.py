@@ -36,3 +36,5 @@ class NestDevice:
         self.device_id = device_id
         self.device_name = device_name
         self.google_home_device_id = google_home_device_id
+        # Constant-fold the URI template once; the device id never changes
+        self.download_video_url = self.DOWNLOAD_VIDEO_URI.format(device_id=device_id)
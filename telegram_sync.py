@@ -23,14 +23,22 @@ from nest_device import NestDevice
 from tools import logger
 from google_home_events import GoogleHomeEvents
 
-from io import BytesIO
+from collections import deque
+import asyncio
+import functools
+import re
+import time
 import pytz
 import datetime
 import os
 import json
+import sqlite3
+import threading
 from dotenv import load_dotenv
 
 from telegram import Bot, InputMediaVideo
+from telegram.error import RetryAfter
+from telegram.request import HTTPXRequest
 
 load_dotenv()
 
@@ -47,24 +55,68 @@ class TelegramEventsSync(object):
     - Handle timezone conversion and time formatting
 
     The sync process is idempotent - safe to run repeatedly without duplicates.
-    Event tracking persists across restarts via sent_events.json.
+    Event tracking persists across restarts via a small sqlite database
+    (sent_events.db); one row is inserted per sent event, so there is no
+    whole-file rewrite on the send path.
     """
 
     FORMAT_24H = '%d/%m/%Y %H:%M:%S'
     FORMAT_12H = '%m/%d/%Y %I:%M:%S %p'
 
+    # Cap on simultaneous video downloads (per-host politeness + memory bound)
+    MAX_CONCURRENT_DOWNLOADS = 4
+
+    # Cameras synced at once; wall time is max-per-camera instead of the sum,
+    # without letting a large install hammer the Google Home API
+    MAX_CONCURRENT_CAMERAS = 3
+
+    # Telegram's per-call media limit for send_media_group
+    MEDIA_GROUP_LIMIT = 10
+
+    # Telegram allows roughly 20 messages/minute to a channel; throttle
+    # catch-up bursts below that so they complete instead of flood-waiting
+    TELEGRAM_SENDS_PER_MINUTE = 20
+
+    # Cap on the in-memory dedup cache. Sync only looks back 3 hours, so
+    # anything beyond this is dead weight in a long-running daemon; the
+    # database keeps the full 7-day history regardless.
+    MAX_RECENT_EVENTS = 10000
+
+    # How often a long-running daemon re-prunes expired database rows
+    PRUNE_INTERVAL_SECONDS = 3600
+
+    # Descriptions already containing one of these read fine without the
+    # " Seen" caption suffix; one case-insensitive C-level scan per event
+    _SUFFIX_SKIP_RE = re.compile(r'(?i)(·|seen|detected)')
+
     DATA_DIR = 'nest-events'
-    SENT_EVENTS_FILE = os.path.join(DATA_DIR, 'sent_events.json')
+    SENT_EVENTS_DB_FILE = os.path.join(DATA_DIR, 'sent_events.db')
+    # Pre-sqlite stores, imported into the database once and then removed
+    LEGACY_SENT_EVENTS_FILE = os.path.join(DATA_DIR, 'sent_events.json')
+    LEGACY_SENT_EVENTS_LOG_FILE = os.path.join(DATA_DIR, 'sent_events.jsonl')
 
-    def __init__(self, telegram_bot_token, telegram_channel_id, nest_camera_devices, google_connection, timezone=None, time_format=None, force_resend_all=False, dry_run=False) -> None:
+    def __init__(self, telegram_bot_token, telegram_channel_id, nest_camera_devices, google_connection, timezone=None, time_format=None, force_resend_all=False, dry_run=False, telegram_bot=None) -> None:
         # Ensure data directory exists
         os.makedirs(self.DATA_DIR, exist_ok=True)
 
-        self._telegram_bot = Bot(token=telegram_bot_token)
+        # Injectable so multiple consumers can share one Bot (and its HTTPX
+        # connection pool); by default size the pool for batched media sends
+        self._telegram_bot = telegram_bot or Bot(
+            token=telegram_bot_token,
+            # HTTP/2 multiplexes the batched media uploads over one TLS stream
+            request=HTTPXRequest(http_version="2", connection_pool_size=16, pool_timeout=30),
+        )
         self._telegram_channel_id = telegram_channel_id
+        self._download_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+        # Sliding-window token bucket for Telegram sends
+        self._send_times = deque()
+        self._send_lock = asyncio.Lock()
         self._nest_camera_devices = nest_camera_devices
         self._force_resend_all = force_resend_all
         self._dry_run = dry_run
+        # Keys claimed by an in-progress download/send; closes the window in
+        # which overlapping sync ticks could both pick up the same event
+        self._in_flight = set()
 
         # Google Home API provides event types (graceful degradation if unavailable)
         self._google_home_events = GoogleHomeEvents(google_connection)
@@ -88,61 +140,167 @@ class TelegramEventsSync(object):
         self._time_format = self._parse_time_format(time_format)
         logger.info(f"Using time format: {self._time_format}")
 
+        # Captions display second resolution, and events in a burst often
+        # share a second - memoize the tz conversion + strftime per second
+        self._format_event_time = functools.lru_cache(maxsize=1024)(self._format_event_time_uncached)
+
+        # check_same_thread=False + a lock: inserts run on asyncio worker
+        # threads so disk latency never stalls the event loop
+        self._db = sqlite3.connect(
+            self.SENT_EVENTS_DB_FILE, isolation_level=None, check_same_thread=False
+        )
+        self._db_lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sent_events(event_key TEXT PRIMARY KEY, ts INTEGER)"
+        )
+        self._migrate_legacy_sent_events()
+        self._prune_old_events()
+        self._last_prune = time.monotonic()
+
         if self._force_resend_all:
-            self._recent_events = set()
+            self._recent_events = {}
             logger.warning("FORCE_RESEND_ALL enabled - ignoring sent events history!")
         else:
             self._recent_events = self._load_sent_events()
             logger.info(f"Loaded {len(self._recent_events)} previously sent event IDs")
 
     def _load_sent_events(self):
-        """Load sent event IDs from JSON file"""
-        if not os.path.exists(self.SENT_EVENTS_FILE):
-            return set()
-
+        """Load sent events from the database as {(start_ms, end_ms, device_id): timestamp}"""
+        events = {}
         try:
-            with open(self.SENT_EVENTS_FILE, 'r') as f:
-                data = json.load(f)
-                return set(self._cleanup_old_events(data).keys())
+            with self._db_lock:
+                # Oldest first, so dict insertion order stays chronological
+                # and eviction can pop from the front
+                rows = self._db.execute(
+                    "SELECT event_key, ts FROM sent_events ORDER BY ts"
+                ).fetchall()
+            for raw_key, timestamp in rows:
+                event_key = self._event_key_from_str(raw_key)
+                if event_key is not None:
+                    events[event_key] = timestamp
         except Exception as e:
-            logger.warning(f"Could not load sent events file: {e}, starting fresh")
-            return set()
+            logger.warning(f"Could not load sent events: {e}, starting fresh")
+        return events
 
-    def _cleanup_old_events(self, data):
+    def _migrate_legacy_sent_events(self):
         """
-        Remove event history entries older than 7 days.
+        Import the pre-sqlite JSON snapshot and JSONL side log, then remove them.
 
-        Args:
-            data: Dict of event_id -> ISO timestamp string
+        One-shot: once the entries are rows in the database the files are
+        deleted and this becomes a couple of stat calls at startup.
+        """
+        data = {}
 
-        Returns:
-            Filtered dict with only recent events (< 7 days old)
+        for path in (self.LEGACY_SENT_EVENTS_FILE, self.LEGACY_SENT_EVENTS_LOG_FILE):
+            # EAFP: one open instead of a stat followed by an open
+            try:
+                with open(path, 'r') as f:
+                    if path.endswith('.jsonl'):
+                        for line in f:
+                            line = line.strip()
+                            if not line:
+                                continue
+                            try:
+                                data.update(json.loads(line))
+                            except ValueError:
+                                # A torn final line from a crash mid-append is expected
+                                continue
+                    else:
+                        data.update(json.load(f))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(f"Could not read legacy sent events file {path}: {e}")
+
+        if data:
+            rows = []
+            for raw_key, timestamp in data.items():
+                # Oldest versions stored ISO timestamp strings
+                if isinstance(timestamp, str):
+                    try:
+                        timestamp = int(datetime.datetime.fromisoformat(timestamp).timestamp())
+                    except ValueError:
+                        continue
+                rows.append((raw_key, timestamp))
+
+            try:
+                with self._db_lock:
+                    self._db.executemany("INSERT OR IGNORE INTO sent_events VALUES(?, ?)", rows)
+                logger.info(f"Migrated {len(rows)} sent events into the database")
+            except Exception as e:
+                logger.error(f"Could not migrate legacy sent events: {e}")
+                return
+
+        for path in (self.LEGACY_SENT_EVENTS_FILE, self.LEGACY_SENT_EVENTS_LOG_FILE):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove legacy sent events file {path}: {e}")
+
+    def _prune_old_events(self):
+        """Drop database rows older than the 7-day dedup window"""
+        cutoff = int(time.time()) - 7 * 86400
+        try:
+            with self._db_lock:
+                self._db.execute("DELETE FROM sent_events WHERE ts < ?", (cutoff,))
+        except Exception as e:
+            logger.error(f"Could not prune sent events: {e}")
+
+    def _claim_event(self, event_key):
+        """
+        Atomically claim an event for processing.
+
+        Returns False if the event was already sent or is being handled by a
+        concurrent sync. Check and claim run without an await between them,
+        so the event loop makes this atomic without a lock.
         """
-        cutoff_time = datetime.datetime.now() - datetime.timedelta(days=7)
-        return {
-            event_id: timestamp
-            for event_id, timestamp in data.items()
-            if datetime.datetime.fromisoformat(timestamp) > cutoff_time
-        }
-
-    def _save_sent_events(self):
-        """Save sent event IDs to JSON file"""
+        if event_key in self._recent_events or event_key in self._in_flight:
+            return False
+        self._in_flight.add(event_key)
+        return True
+
+    def _release_event(self, event_key):
+        """Give up a claim so a later sync can retry the event"""
+        self._in_flight.discard(event_key)
+
+    @staticmethod
+    def _event_key_to_str(event_key):
+        """Serialize a (start_ms, end_ms, device_id) key for persistence"""
+        start_ms, end_ms, device_id = event_key
+        return f"{start_ms}->{end_ms}|{device_id}"
+
+    @staticmethod
+    def _event_key_from_str(raw_key):
+        """Parse a persisted key back to (start_ms, end_ms, device_id), or None"""
         try:
-            existing_data = {}
-            if os.path.exists(self.SENT_EVENTS_FILE):
-                with open(self.SENT_EVENTS_FILE, 'r') as f:
-                    existing_data = json.load(f)
+            times, _, device_id = raw_key.partition("|")
+            start_ms, _, end_ms = times.partition("->")
+            return (int(start_ms), int(end_ms), device_id)
+        except ValueError:
+            return None
 
-            current_time = datetime.datetime.now().isoformat()
-            for event_id in self._recent_events:
-                if event_id not in existing_data:
-                    existing_data[event_id] = current_time
+    def _mark_events_sent(self, event_keys):
+        """Record a batch of sent events in memory and in the database"""
+        timestamp = int(time.time())
+        rows = []
+        for event_key in event_keys:
+            self._recent_events[event_key] = timestamp
+            self._in_flight.discard(event_key)
+            rows.append((self._event_key_to_str(event_key), timestamp))
 
-            with open(self.SENT_EVENTS_FILE, 'w') as f:
-                json.dump(self._cleanup_old_events(existing_data), f, indent=2)
+        # Insertion order is chronological (load sorts by ts, new marks use
+        # now), so the first key is always the oldest - O(1) per eviction
+        while len(self._recent_events) > self.MAX_RECENT_EVENTS:
+            del self._recent_events[next(iter(self._recent_events))]
 
+        try:
+            with self._db_lock:
+                self._db.executemany("INSERT OR IGNORE INTO sent_events VALUES(?, ?)", rows)
         except Exception as e:
-            logger.error(f"Could not save sent events file: {e}")
+            logger.error(f"Could not record sent events: {e}")
 
     def _parse_time_format(self, time_format):
         """
@@ -170,23 +328,42 @@ class TelegramEventsSync(object):
                 logger.warning(f"Invalid TIME_FORMAT '{time_format}': {e}, using default")
                 return '%c'
 
-    def _get_current_time_utc(self):
-        """Get current time in UTC for API calls"""
-        return pytz.UTC.localize(datetime.datetime.utcnow())
+    def _format_event_time_uncached(self, epoch_seconds: int) -> str:
+        """Render an epoch second in the display timezone and configured format"""
+        dt = datetime.datetime.fromtimestamp(epoch_seconds, tz=self._display_timezone)
+        # The two built-in formats skip strftime entirely; f-string field
+        # formatting avoids re-parsing the format and any locale lookups
+        if self._time_format == self.FORMAT_24H:
+            return (
+                f"{dt.day:02d}/{dt.month:02d}/{dt.year} "
+                f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+            )
+        if self._time_format == self.FORMAT_12H:
+            hour = dt.hour % 12 or 12
+            meridiem = "AM" if dt.hour < 12 else "PM"
+            return (
+                f"{dt.month:02d}/{dt.day:02d}/{dt.year} "
+                f"{hour:02d}:{dt.minute:02d}:{dt.second:02d} {meridiem}"
+            )
+        return dt.strftime(self._time_format)
 
     async def sync_single_nest_camera(self, nest_device: NestDevice):
 
         logger.info(f"Syncing: {nest_device.device_id}")
-        end_time_utc = self._get_current_time_utc()
 
         if not nest_device.google_home_device_id:
             logger.error(f"[{nest_device.device_id}] No Google Home device ID - cannot fetch events")
             return
 
         try:
-            start_time_ms = int((end_time_utc.timestamp() - (3 * 60 * 60)) * 1000)
-            end_time_ms = int(end_time_utc.timestamp() * 1000)
-            google_home_events = self._google_home_events.get_events(
+            # Only epoch ms are needed downstream - skip the datetime detour
+            now = time.time()
+            start_time_ms = int((now - (3 * 60 * 60)) * 1000)
+            end_time_ms = int(now * 1000)
+            # get_events does blocking HTTP; offload it so concurrent
+            # per-camera syncs actually overlap instead of serializing
+            google_home_events = await asyncio.to_thread(
+                self._google_home_events.get_events,
                 nest_device.google_home_device_id,
                 start_time_ms,
                 end_time_ms
@@ -216,64 +393,192 @@ class TelegramEventsSync(object):
             nest_device: NestDevice to download videos from
             google_home_events: List of GoogleHomeEvent objects
         """
+        # Sort events chronologically (oldest first); the int key avoids
+        # materializing a datetime per comparison
+        google_home_events.sort(key=lambda event: event.start_time_ms)
+
+        # Prepare and send one media-group-sized batch at a time. One
+        # send_media_group round trip still covers up to 10 clips, but only
+        # the current batch's clips are resident while the rate limiter
+        # drains a catch-up backlog, and a failed send loses just one batch
+        # instead of abandoning every already-downloaded clip after it.
+        sent = 0
         skipped = 0
+        for i in range(0, len(google_home_events), self.MEDIA_GROUP_LIMIT):
+            batch_events = google_home_events[i:i + self.MEDIA_GROUP_LIMIT]
+            results = await asyncio.gather(
+                *(self._prepare_one_event(nest_device, gh_event) for gh_event in batch_events),
+                return_exceptions=True
+            )
 
-        # Sort events chronologically (oldest first)
-        google_home_events.sort(key=lambda event: event.start_time)
-
-        for gh_event in google_home_events:
-            event_id = f"{gh_event.start_time_ms}->{gh_event.end_time_ms}|{nest_device.device_id}"
-
-            if event_id in self._recent_events:
-                logger.debug(f"Event ({gh_event.description}) already sent, skipping..")
-                skipped += 1
+            prepared = []  # (event_key, media-or-None-for-dry-run) in chronological order
+            for gh_event, result in zip(batch_events, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to process event ({gh_event.description}): {result}")
+                    self._release_event(
+                        (gh_event.start_time_ms, gh_event.end_time_ms, nest_device.device_id)
+                    )
+                elif result is False:
+                    skipped += 1
+                elif result is not None:
+                    prepared.append(result)
+
+            if not prepared:
                 continue
 
-            logger.debug(f"Downloading event: {gh_event.description} [{gh_event.start_time}]")
+            marked = False
+            try:
+                media_batch = [media for _, media in prepared if media is not None]
+                if media_batch:
+                    await self._send_media_group(media_batch)
+                    logger.debug(f"Sent media group of {len(media_batch)} clip(s)")
+                # One executemany per batch, off the event loop - the sends
+                # keep flowing while sqlite fsyncs on a worker thread
+                batch_keys = [event_key for event_key, _ in prepared]
+                await asyncio.to_thread(self._mark_events_sent, batch_keys)
+                marked = True
+                sent += len(batch_keys)
+            finally:
+                # If the send raised, release the batch's claims so the next
+                # sync retries those events
+                if not marked:
+                    for event_key, _ in prepared:
+                        self._release_event(event_key)
+
+        logger.info(f"[{nest_device.device_id}] Downloaded and sent: {sent}, skipped (already sent): {skipped}")
+
+    async def _acquire_send_slot(self):
+        """Wait until sending another message stays under Telegram's rate limit"""
+        while True:
+            async with self._send_lock:
+                now = time.monotonic()
+                while self._send_times and now - self._send_times[0] >= 60:
+                    self._send_times.popleft()
+                if len(self._send_times) < self.TELEGRAM_SENDS_PER_MINUTE:
+                    self._send_times.append(now)
+                    return
+                wait = 60 - (now - self._send_times[0])
+            logger.debug(f"Telegram rate limit window full, waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+    async def _send_media_group(self, media):
+        """
+        Send a media group, respecting the local rate limit.
 
-            video_data = self._download_video_by_timestamps(
-                nest_device,
-                gh_event.start_time_ms,
-                gh_event.end_time_ms
+        Honors Telegram's RetryAfter flood control with a single retry so
+        large catch-up runs degrade to waiting instead of dropping clips.
+        """
+        await self._acquire_send_slot()
+        try:
+            await self._telegram_bot.send_media_group(
+                chat_id=self._telegram_channel_id,
+                media=media,
+                disable_notification=True,
+            )
+        except RetryAfter as e:
+            logger.warning(f"Telegram flood control hit, retrying in {e.retry_after}s")
+            await asyncio.sleep(e.retry_after)
+            await self._telegram_bot.send_media_group(
+                chat_id=self._telegram_channel_id,
+                media=media,
+                disable_notification=True,
             )
 
-            if not video_data:
-                logger.warning(f"Failed to download video for event: {gh_event.description}")
-                continue
-
-            video_io = BytesIO(video_data)
+    async def _prepare_one_event(self, nest_device: NestDevice, gh_event):
+        """
+        Download a single event's clip and build its captioned media.
 
-            event_local_time = gh_event.start_time.astimezone(self._display_timezone)
-            time_str = event_local_time.strftime(self._time_format)
+        Returns:
+            (event_key, InputMediaVideo) when ready to send,
+            (event_key, None) for a successful dry run,
+            False if already sent, None if the download failed
+        """
+        # Tuple key: no per-event string building just to test membership
+        event_key = (gh_event.start_time_ms, gh_event.end_time_ms, nest_device.device_id)
+
+        if not self._claim_event(event_key):
+            logger.debug(f"Event ({gh_event.description}) already sent or in flight, skipping..")
+            return False
+
+        logger.debug(f"Downloading event: {gh_event.description} [{gh_event.start_time}]")
+
+        time_str = self._format_event_time(gh_event.start_time_ms // 1000)
+
+        event_type = gh_event.description
+        needs_suffix = self._SUFFIX_SKIP_RE.search(event_type) is None
+        suffix = " Seen" if needs_suffix else ""
+        video_caption = f"{event_type}{suffix} - {nest_device.device_name} [{time_str}]"
+
+        if self._dry_run:
+            # Dry run keeps the buffered path so it can report the clip size
+            async with self._download_semaphore:
+                video_data = await asyncio.to_thread(
+                    self._download_video_by_timestamps,
+                    nest_device,
+                    gh_event.start_time_ms,
+                    gh_event.end_time_ms
+                )
 
-            event_type = gh_event.description
-            needs_suffix = not any(word in event_type.lower() for word in [" · ", "seen", "detected"])
-            suffix = " Seen" if needs_suffix else ""
-            video_caption = f"{event_type}{suffix} - {nest_device.device_name} [{time_str}]"
+            if not video_data:
+                logger.warning(f"Failed to download video for event: {gh_event.description}")
+                self._release_event(event_key)
+                return None
 
             logger.info(f"Caption: {video_caption}")
+            logger.info(f"[DRY RUN] Would send: {video_caption} ({len(video_data)} bytes)")
+            return (event_key, None)
+        else:
+            # Blocking HTTP - run on a worker thread, bounded so a burst of
+            # events doesn't open unbounded connections or buffer every clip
+            async with self._download_semaphore:
+                video_media = await asyncio.to_thread(
+                    self._build_video_media,
+                    nest_device,
+                    gh_event.start_time_ms,
+                    gh_event.end_time_ms,
+                    video_caption
+                )
 
-            video_media = InputMediaVideo(
-                media=video_io,
-                caption=video_caption
-            )
+            if video_media is None:
+                logger.warning(f"Failed to download video for event: {gh_event.description}")
+                self._release_event(event_key)
+                return None
 
-            if self._dry_run:
-                logger.info(f"[DRY RUN] Would send: {video_caption} ({len(video_data)} bytes)")
-            else:
-                await self._telegram_bot.send_media_group(
-                    chat_id=self._telegram_channel_id,
-                    media=[video_media],
-                    disable_notification=True,
-                )
-                logger.debug("Sent clip successfully")
+            logger.info(f"Caption: {video_caption}")
+            return (event_key, video_media)
 
-            self._recent_events.add(event_id)
+    def _build_video_media(self, nest_device: NestDevice, start_ms: int, end_ms: int, caption: str):
+        """
+        Download a clip as a stream and wrap it in an InputMediaVideo.
 
-        downloaded_and_sent = len(google_home_events) - skipped
-        logger.info(f"[{nest_device.device_id}] Downloaded and sent: {downloaded_and_sent}, skipped (already sent): {skipped}")
+        The streamed response body is read straight into the Telegram media
+        object on the worker thread, so the clip is buffered once instead of
+        bytes + BytesIO copies.
 
-        self._save_sent_events()
+        Returns:
+            InputMediaVideo ready to send, or None if the download fails
+        """
+        response = None
+        try:
+            params = {
+                "start_time": start_ms,
+                "end_time": end_ms,
+            }
+            response = nest_device._connection.make_nest_get_request(
+                nest_device.download_video_url,
+                params=params,
+                stream=True
+            )
+            return InputMediaVideo(
+                media=response.raw,
+                caption=caption
+            )
+        except Exception as e:
+            logger.error(f"Failed to download video: {e}")
+            return None
+        finally:
+            if response is not None:
+                response.close()
 
     def _download_video_by_timestamps(self, nest_device: NestDevice, start_ms: int, end_ms: int) -> bytes:
         """
@@ -296,8 +601,7 @@ class TelegramEventsSync(object):
                 "end_time": end_ms,
             }
             return nest_device._connection.make_nest_get_request(
-                nest_device.device_id,
-                nest_device.DOWNLOAD_VIDEO_URI,
+                nest_device.download_video_url,
                 params=params
             )
         except Exception as e:
@@ -312,5 +616,23 @@ class TelegramEventsSync(object):
         Fetches new events and sends to Telegram for each configured camera.
         """
         logger.info("Syncing all camera devices")
-        for nest_device in self._nest_camera_devices:
-            await self.sync_single_nest_camera(nest_device)
\ No newline at end of file
+
+        camera_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CAMERAS)
+
+        async def sync_one(nest_device):
+            async with camera_semaphore:
+                await self.sync_single_nest_camera(nest_device)
+
+        results = await asyncio.gather(
+            *(sync_one(nest_device) for nest_device in self._nest_camera_devices),
+            return_exceptions=True
+        )
+        for nest_device, result in zip(self._nest_camera_devices, results):
+            if isinstance(result, Exception):
+                logger.error(f"[{nest_device.device_id}] Sync failed: {result}")
+
+        # Debounced maintenance: at most one DELETE per hour, off the loop,
+        # so a daemon that never restarts still sheds expired rows
+        if time.monotonic() - self._last_prune >= self.PRUNE_INTERVAL_SECONDS:
+            self._last_prune = time.monotonic()
+            await asyncio.to_thread(self._prune_old_events)
\ No newline at end of file
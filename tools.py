@@ -15,23 +15,44 @@ numeric_level = getattr(logging, log_level, logging.INFO)
 VERBOSE = os.getenv('VERBOSE', 'false').lower() in ('true', '1')
 
 
+# All token shapes in one alternation so each string is scanned once by the
+# regex engine instead of once per pattern. The kept prefixes (bot id, first
+# chars of Google tokens) identify which credential appeared without leaking it.
+_SENSITIVE_RE = re.compile(
+    r'(?P<tg>(?:/bot)?\d{9,10}):[A-Za-z0-9_-]{25,}'
+    r'|(?P<aas>aas_et/[A-Za-z0-9_-]{6})[A-Za-z0-9_/+=\-]{50,}'
+    r'|(?P<oauth>[ya]\w{0,3}\.[A-Za-z0-9_-]{6})[A-Za-z0-9_\-\.]{50,}'
+)
+
+
+def _mask_match(match):
+    if match.group('tg') is not None:
+        return f"{match.group('tg')}:[telegram-bot-token-masked]"
+    if match.group('aas') is not None:
+        return f"{match.group('aas')}[google-master-token-masked]"
+    return f"{match.group('oauth')}[oauth-access-token-masked]"
+
+
+# Every maskable token contains one of these substrings (':' for telegram
+# tokens, '.' for oauth tokens, 'aas_et/' for master tokens), so strings
+# without any of them - the overwhelming majority of log records - can skip
+# the regex engine entirely.
+_SENSITIVE_NEEDLES = (':', '.', 'aas_et/')
+
+
+def _mask_sensitive(text):
+    """Mask any credentials found in text, preserving identifying prefixes"""
+    for needle in _SENSITIVE_NEEDLES:
+        if needle in text:
+            return _SENSITIVE_RE.sub(_mask_match, text)
+    return text
+
+
 class SensitiveFormatter(logging.Formatter):
     """Custom formatter that masks sensitive tokens in the final output"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.patterns = [
-            (re.compile(r'(\d{9,10}):([A-Za-z0-9_-]{25,})'), r'\1:[telegram-bot-token-masked]'),
-            (re.compile(r'(/bot)(\d{9,10}):([A-Za-z0-9_-]{25,})'), r'\1\2:[telegram-bot-token-masked]'),
-            (re.compile(r'(aas_et/[A-Za-z0-9_-]{6})[A-Za-z0-9_/+=\-]{50,}'), r'\1[google-master-token-masked]'),
-            (re.compile(r'([ya]\w{0,3}\.[A-Za-z0-9_-]{6})[A-Za-z0-9_\-\.]{50,}'), r'\1[oauth-access-token-masked]'),
-        ]
-
     def format(self, record):
-        original = super().format(record)
-        for pattern, replacement in self.patterns:
-            original = pattern.sub(replacement, original)
-        return original
+        return _mask_sensitive(super().format(record))
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -43,30 +64,19 @@ class SensitiveDataFilter(logging.Filter):
     - Google master tokens (shows first 6 chars)
     - OAuth access tokens (shows first 6 chars)
 
-    Uses regex patterns to find and replace sensitive strings while preserving
-    enough context to identify which token is being used.
+    A single combined regex finds and replaces sensitive strings while
+    preserving enough context to identify which token is being used.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.patterns = [
-            (re.compile(r'(\d{9,10}):([A-Za-z0-9_-]{25,})'), r'\1:[telegram-bot-token-masked]'),
-            (re.compile(r'(/bot)(\d{9,10}):([A-Za-z0-9_-]{25,})'), r'\1\2:[telegram-bot-token-masked]'),
-            (re.compile(r'(aas_et/[A-Za-z0-9_-]{6})[A-Za-z0-9_/+=\-]{50,}'), r'\1[google-master-token-masked]'),
-            (re.compile(r'([ya]\w{0,3}\.[A-Za-z0-9_-]{6})[A-Za-z0-9_\-\.]{50,}'), r'\1[oauth-access-token-masked]'),
-        ]
-
     def filter(self, record):
         if isinstance(record.msg, str):
-            for pattern, replacement in self.patterns:
-                record.msg = pattern.sub(replacement, record.msg)
+            record.msg = _mask_sensitive(record.msg)
 
         if record.args:
             new_args = []
             for arg in record.args if isinstance(record.args, tuple) else [record.args]:
                 if isinstance(arg, str):
-                    for pattern, replacement in self.patterns:
-                        arg = pattern.sub(replacement, arg)
+                    arg = _mask_sensitive(arg)
                 new_args.append(arg)
             record.args = tuple(new_args) if isinstance(record.args, tuple) else new_args[0]
 